@@ -0,0 +1,245 @@
+from typing import Any, Dict, List
+import orjson
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from mocky.serialization import example_merger, json_dumps
+
+_UNSUPPORTED_MEDIA_TYPE_BODY = json_dumps({"error": "Unsupported Media Type"})
+_INVALID_REQUEST_BODY = json_dumps({"error": "Invalid request body"})
+_METHOD_NOT_SUPPORTED_BODY = json_dumps({"error": "Method not supported"})
+
+
+def _bytes_response(body: bytes, status_code: int = 200) -> Response:
+    """
+    Wrap an already serialized JSON body in a response.
+
+    Args:
+        body (bytes): The JSON encoded response body.
+        status_code (int): The HTTP status code for the response. Defaults to 200.
+
+    Returns:
+        Response: A response with an ``application/json`` body.
+    """
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+def _is_json(content_type: str) -> bool:
+    """
+    Check whether a content type is JSON, matching Werkzeug's ``Request.is_json``.
+
+    Args:
+        content_type (str): The value of the Content-Type header.
+
+    Returns:
+        bool: True for ``application/json`` and ``application/*+json`` content types.
+    """
+    mimetype = content_type.split(";", 1)[0].strip().lower()
+    return mimetype == "application/json" or (
+        mimetype.startswith("application/") and mimetype.endswith("+json")
+    )
+
+
+async def _read_json(request: Request) -> Any:
+    """
+    Decode the JSON request body.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        Any: The decoded body, or None if it is not valid JSON.
+    """
+    try:
+        return orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return None
+
+
+def create_handler(operation: Dict[str, Any], example: Any, method: str):
+    """
+    Create a Starlette request handler for the given operation.
+
+    The handlers mirror the Flask handlers created by ``MockyApp.create_handler``,
+    with response bodies serialized when the route is created wherever possible.
+
+    Args:
+        operation (Dict[str, Any]): The operation details, including parameters.
+        example (Any): An example response to be used as a base for the response.
+        method (str): The HTTP method for the request (e.g., 'GET', 'POST', 'PUT', 'DELETE').
+
+    Returns:
+        function: An async request handler.
+    """
+    method = method.lower()
+    if method == "get":
+        return _make_get_handler(operation, example)
+    if method in ("post", "put"):
+        return _make_body_handler(example, require_json_content_type=method == "post")
+    if method == "delete":
+        return _make_delete_handler()
+    return _make_constant_handler(_METHOD_NOT_SUPPORTED_BODY, 405)
+
+
+def _make_get_handler(operation: Dict[str, Any], example: Any):
+    """
+    Create a GET handler that echoes declared query parameters alongside the example.
+
+    Only declared query parameters present in the request are echoed.
+
+    Args:
+        operation (Dict[str, Any]): The operation details, including parameters.
+        example (Any): The example response.
+
+    Returns:
+        function: The request handler.
+    """
+    query_names = frozenset(
+        param["name"]
+        for param in operation.get("parameters", [])
+        if param.get("in") == "query"
+    )
+    example_body = json_dumps(example)
+    if not query_names:
+        return _make_constant_handler(example_body)
+
+    async def handler(request: Request) -> Response:
+        """GET request handler"""
+        args = request.query_params
+        query_params = {name: args.get(name) for name in query_names & args.keys()}
+        if not query_params:
+            return _bytes_response(example_body)
+        return _bytes_response(json_dumps({**example, "query_params": query_params}))
+
+    return handler
+
+
+def _make_body_handler(example: Any, require_json_content_type: bool):
+    """
+    Create a POST or PUT handler that merges a JSON request body into the example.
+
+    Args:
+        example (Any): The example response.
+        require_json_content_type (bool): Reject requests whose Content-Type is not
+            exactly ``application/json`` with 415, as the POST handler does.
+
+    Returns:
+        function: The request handler.
+    """
+    merge = example_merger(example)
+    example_body = json_dumps(example)
+
+    async def handler(request: Request) -> Response:
+        """POST/PUT request handler"""
+        content_type = request.headers.get("content-type", "")
+        if require_json_content_type and content_type != "application/json":
+            return _bytes_response(_UNSUPPORTED_MEDIA_TYPE_BODY, 415)
+        if not _is_json(content_type):
+            return _bytes_response(_INVALID_REQUEST_BODY, 400)
+
+        data = await _read_json(request)
+        if data is None:
+            return _bytes_response(_INVALID_REQUEST_BODY, 400)
+        if merge is not None and isinstance(data, dict):
+            return _bytes_response(merge(data))
+
+        return _bytes_response(example_body)
+
+    return handler
+
+
+def _make_delete_handler():
+    """
+    Create a DELETE handler.
+
+    Responds with an empty 204, as a 204 response cannot carry a body.
+
+    Returns:
+        function: The request handler.
+    """
+
+    async def handler(request: Request) -> Response:
+        """DELETE request handler"""
+        return Response(status_code=204)
+
+    return handler
+
+
+def _make_constant_handler(body: bytes, status_code: int = 200):
+    """
+    Create a handler that always returns the same JSON body.
+
+    Args:
+        body (bytes): The JSON encoded response body.
+        status_code (int): The HTTP status code for the response. Defaults to 200.
+
+    Returns:
+        function: The request handler.
+    """
+
+    async def handler(request: Request) -> Response:
+        """Constant response handler"""
+        return _bytes_response(body, status_code)
+
+    return handler
+
+
+def _routes_body(routes: List[Route]) -> bytes:
+    """
+    Serialize the list of routes for the routes endpoint.
+
+    Args:
+        routes (List[Route]): The application routes.
+
+    Returns:
+        bytes: The JSON encoded list of paths and allowed methods (excluding "HEAD").
+    """
+    return json_dumps(
+        [
+            {
+                "path": route.path,
+                "methods": [m for m in route.methods if m != "HEAD"],
+            }
+            for route in routes
+        ]
+    )
+
+
+def create_starlette_app(mocky_app, openapi_spec: Dict[str, Any]) -> Starlette:
+    """
+    Create a Starlette application serving the routes of the OpenAPI specification.
+
+    Args:
+        mocky_app (MockyApp): The Mocky application providing the parsed arguments,
+            metrics and fixed route bodies.
+        openapi_spec (Dict[str, Any]): The OpenAPI specification containing paths and methods.
+
+    Returns:
+        Starlette: The ASGI application.
+    """
+    routes = [
+        Route(
+            openapi_path,
+            create_handler(operation, example, method),
+            methods=[method.upper()],
+        )
+        for openapi_path, method, operation, example in mocky_app.iter_operations(
+            openapi_spec
+        )
+    ]
+    if mocky_app.meter and routes:
+        mocky_app.dynamic_routes_counter.add(len(routes))
+
+    # Register fixed routes
+    routes.append(Route("/", _make_constant_handler(mocky_app.root_body)))
+    routes.append(Route("/mocky/info", _make_constant_handler(mocky_app.info_body)))
+    routes.append(Route("/mocky/health", _make_constant_handler(mocky_app.health_body)))
+    # The routes listing includes its own route, so serialize it with a placeholder
+    listed_routes = routes + [Route("/mocky/routes", _make_constant_handler(b""))]
+    routes.append(
+        Route("/mocky/routes", _make_constant_handler(_routes_body(listed_routes)))
+    )
+
+    return Starlette(debug=mocky_app.args.debug, routes=routes)
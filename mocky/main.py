@@ -1,17 +1,205 @@
-from flask import Flask, jsonify, request, make_response
+from flask import Flask, current_app, request
+from flask.json.provider import JSONProvider
+import orjson
 import yaml
-import json
-from typing import Any, Dict
+from mocky.serialization import example_merger, json_dumps
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+from types import MappingProxyType
 import argparse
+import contextlib
+import functools
+import hashlib
+import importlib
+import mmap
+import os
+import pickle
+import tempfile
 import random
 import string
-from opentelemetry.instrumentation.flask import FlaskInstrumentor
-from opentelemetry import metrics
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import (
-    ConsoleMetricExporter,
-    PeriodicExportingMetricReader,
-)
+
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader
+
+try:
+    import yaml_rs
+except ImportError:
+    yaml_rs = None
+
+_PATH_XLATE = str.maketrans({"{": "<", "}": ">"})
+
+# Read buffer used for files that cannot be memory mapped
+_READ_BUFFER_SIZE = 1 << 17
+
+# Threads per gunicorn worker; gunicorn's default of one makes gthread workers
+# behave like sync workers
+_GUNICORN_THREADS = 4
+
+
+@contextlib.contextmanager
+def _map_file(file: BinaryIO) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Provide the contents of a binary file, memory mapped where possible.
+
+    Empty files and non-regular files such as pipes cannot be mapped, so their
+    contents are read instead.
+
+    Args:
+        file (BinaryIO): The open file.
+
+    Yields:
+        Union[mmap.mmap, bytes]: A read-only map of the file, or its contents.
+    """
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        yield file.read()
+        return
+    with mapped:
+        yield mapped
+
+
+def _load_yaml(data: Union[mmap.mmap, bytes]) -> Any:
+    """
+    Load a YAML document using the fastest parser available.
+
+    Prefers the Rust-backed ``yaml_rs`` parser when it is installed, then PyYAML's
+    libyaml bindings, and finally the pure-Python PyYAML loader. PyYAML reads a
+    memory map directly as a stream.
+
+    Args:
+        data (Union[mmap.mmap, bytes]): The raw contents of the YAML file.
+
+    Returns:
+        Any: The parsed YAML document.
+    """
+    if yaml_rs is not None:
+        # yaml_rs.loads only accepts str, so decode the buffer without copying it first
+        return yaml_rs.loads(str(data, "utf-8"))
+    return yaml.load(data, Loader=CSafeLoader)
+
+
+class _OrjsonProvider(JSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize an object to a JSON string.
+
+        Args:
+            obj (Any): The object to serialize.
+            **kwargs (Any): Accepted for compatibility with ``JSONProvider`` and
+                ignored. Formatting options such as ``indent`` and ``sort_keys`` are
+                not supported, so the output is always compact.
+
+        Returns:
+            str: The JSON encoded object.
+        """
+        return json_dumps(obj).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """
+        Deserialize JSON data.
+
+        Args:
+            s (Any): The JSON document, as ``str`` or ``bytes``.
+            **kwargs (Any): Accepted for compatibility with ``JSONProvider`` and
+                ignored.
+
+        Returns:
+            Any: The decoded object.
+        """
+        return orjson.loads(s)
+
+
+def _raw_json_response(body: bytes, status: int = 200):
+    """
+    Wrap an already serialized JSON body in a response.
+
+    The body is passed through to the WSGI server as-is; Werkzeug derives the
+    ``Content-Length`` header from it when the response is created.
+
+    Args:
+        body (bytes): The JSON encoded response body.
+        status (int): The HTTP status code for the response. Defaults to 200.
+
+    Returns:
+        Response: A response with an ``application/json`` body.
+    """
+    return current_app.response_class(
+        body, status=status, mimetype="application/json", direct_passthrough=True
+    )
+
+
+def _json_response(obj: Any, status: int = 200):
+    """
+    Serialize an object with orjson and wrap it in a JSON response.
+
+    Args:
+        obj (Any): The object to serialize.
+        status (int): The HTTP status code for the response. Defaults to 200.
+
+    Returns:
+        Response: A response with an ``application/json`` body.
+    """
+    return _raw_json_response(json_dumps(obj), status)
+
+
+def _parser_identity() -> str:
+    """
+    Describe the YAML parser in use, for keying the spec cache.
+
+    Different parsers, and different versions of the same parser, can produce
+    different trees from the same file, so cached specs are only reused when the
+    parser is unchanged.
+
+    Returns:
+        str: The parser's name and version.
+    """
+    if yaml_rs is not None:
+        return f"yaml_rs {getattr(yaml_rs, '__version__', 'unknown')}"
+    return f"PyYAML {yaml.__version__} {CSafeLoader.__name__}"
+
+
+def _default_server() -> str:
+    """
+    Pick the server used when ``--server`` is not given.
+
+    gunicorn is not installed on Windows, so fall back to waitress and then to the
+    Flask development server.
+
+    Returns:
+        str: The first of ``gunicorn``, ``waitress`` and ``dev`` that is available.
+    """
+    for server, module in (("gunicorn", "gunicorn.app.base"), ("waitress", "waitress")):
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+        return server
+    return "dev"
+
+
+def _cache_dir() -> str:
+    """
+    Return the directory used to cache parsed OpenAPI specifications.
+
+    Honours ``XDG_CACHE_HOME`` and defaults to ``~/.cache/mocky``.
+
+    Returns:
+        str: The cache directory path.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "mocky")
 
 
 class MockyApp:
@@ -38,6 +226,18 @@ class MockyApp:
         run():
             Run the application server."""
 
+    __slots__ = (
+        "args",
+        "app",
+        "meter",
+        "dynamic_routes_counter",
+        "asgi_app",
+        "root_body",
+        "info_body",
+        "health_body",
+        "_routes_response",
+    )
+
     def __init__(self):
         """
         Initialize the MockyApp class.
@@ -50,6 +250,10 @@ class MockyApp:
             app (Flask): The Flask application instance.
             meter (Meter): The OpenTelemetry meter for metrics collection.
             dynamic_routes_counter (Counter): A counter for tracking dynamic routes.
+            asgi_app (Starlette): The Starlette application, when using ``--framework starlette``.
+            root_body (bytes): The JSON encoded body of the root endpoint.
+            info_body (bytes): The JSON encoded body of the info endpoint.
+            health_body (bytes): The JSON encoded body of the health endpoint.
         Raises:
             RuntimeError: If the OpenTelemetry meter initialization fails.
         """
@@ -86,14 +290,41 @@ class MockyApp:
             help="Enable OpenTelemetry metrics",
             default=False,
         )
+        parser.add_argument(
+            "--server",
+            type=str,
+            choices=["dev", "gunicorn", "waitress"],
+            help="Server used to run the application (defaults to gunicorn, or waitress/dev where gunicorn is not installed; --debug always uses the Flask development server)",
+            default=None,
+        )
+        parser.add_argument(
+            "--framework",
+            type=str,
+            choices=["flask", "starlette"],
+            help="Web framework serving the mocked routes (starlette runs under uvicorn and ignores --server)",
+            default="flask",
+        )
         self.args = parser.parse_args()
+        if self.args.server is None:
+            self.args.server = _default_server()
 
         # Initialize Flask app
         self.app = Flask(__name__)
+        self.app.json = _OrjsonProvider(self.app)
 
-        # Instrument Flask app with OpenTelemetry
+        # Instrument Flask app with OpenTelemetry. The OpenTelemetry packages are
+        # imported here so startup does not pay for them unless --otel is set.
         if self.args.otel:
-            FlaskInstrumentor().instrument_app(self.app)
+            from opentelemetry.instrumentation.flask import FlaskInstrumentor
+            from opentelemetry import metrics
+            from opentelemetry.sdk.metrics import MeterProvider
+            from opentelemetry.sdk.metrics.export import (
+                ConsoleMetricExporter,
+                PeriodicExportingMetricReader,
+            )
+
+            if self.args.framework != "starlette":
+                FlaskInstrumentor().instrument_app(self.app)
             metric_reader = PeriodicExportingMetricReader(ConsoleMetricExporter())
             provider = MeterProvider(metric_readers=[metric_reader])
             metrics.set_meter_provider(provider)
@@ -110,47 +341,79 @@ class MockyApp:
         else:
             self.meter = None
 
+        # Pre-serialize the bodies of the constant fixed routes
+        application_name = "Mocky"
+        application_version = "0.0.1"
+        application_description = "Mocky is a HTTP mock service, it can read OpenAPI 3.1 specification and return example data."
+        application_author = "Michael Leer"
+        application_company = "Gremlin LTD"
+        application_repository = "https://github.com/trozz/mocky"
+
+        application_info_as_dict = {
+            "name": application_name,
+            "version": application_version,
+            "description": application_description,
+            "author": application_author,
+            "company": application_company,
+            "repository": application_repository,
+        }
+        self.root_body = orjson.dumps({"message": "Are you meant to be here?"})
+        self.info_body = orjson.dumps(application_info_as_dict)
+        self.health_body = orjson.dumps({"status": "ok"})
+
         # Load, parse OpenAPI, and register routes
+        self.asgi_app = None
         self.load_and_register_routes()
 
-        # Register fixed routes
-        self.app.add_url_rule("/", view_func=self.root)
-        self.app.add_url_rule("/mocky/info", view_func=self.info)
-        self.app.add_url_rule("/mocky/health", view_func=self.health)
-        self.app.add_url_rule("/mocky/routes", view_func=self.routes)
+        # Register fixed routes, which the Starlette app registers itself
+        if self.args.framework != "starlette":
+            self.app.add_url_rule("/", view_func=self.root)
+            self.app.add_url_rule("/mocky/info", view_func=self.info)
+            self.app.add_url_rule("/mocky/health", view_func=self.health)
+            self.app.add_url_rule("/mocky/routes", view_func=self.routes)
+            self._refresh_routes_response()
 
     def load_and_register_routes(self):
         """
         Load OpenAPI file and register routes based on the specification.
         This method attempts to load an OpenAPI file specified by the user, parse it,
         and register the routes defined in the specification. It supports both YAML
-        and JSON file formats.
+        and JSON file formats. With ``--framework starlette`` the routes are served by
+        a Starlette application stored in ``asgi_app`` instead of the Flask app.
         Raises:
             ValueError: If the file format is unsupported or if parsing the OpenAPI file fails.
+            RuntimeError: If ``--framework starlette`` is used without starlette installed.
             Exception: If there is an error while loading the OpenAPI file or registering routes.
         """
+        if self.args.framework == "starlette":
+            try:
+                from mocky.asgi import create_starlette_app
+            except ImportError:
+                self.app.logger.error("starlette is not installed")
+                raise RuntimeError(
+                    "starlette is not installed. Install mocky[starlette] or use --framework flask."
+                )
+
         try:
             openapi_spec = self._parse_openapi(self.args.file)
-            self.register_routes(openapi_spec)
+            if self.args.framework == "starlette":
+                self.asgi_app = create_starlette_app(self, openapi_spec)
+            else:
+                self.register_routes(openapi_spec)
         except Exception as e:
             self.app.logger.error(f"Failed to load OpenAPI file: {e}")
             raise e
 
-        try:
-            with open(self.args.file, "r") as file:
-                if self.args.file.endswith(".yaml") or self.args.file.endswith(".yml"):
-                    return yaml.safe_load(file)
-                elif self.args.file.endswith(".json"):
-                    return json.load(file)
-                else:
-                    raise ValueError("Unsupported file format. Use JSON or YAML.")
-        except Exception as e:
-            raise ValueError(f"Failed to parse OpenAPI file: {e}")
-
     def _parse_openapi(self, file_path: str) -> Dict[str, Any]:
         """
         Parse the OpenAPI file and return the specification as a dictionary.
 
+        The file is memory mapped rather than read through Python's buffered IO.
+        Parsed YAML specifications are cached on disk, one entry per source file. An
+        entry is only used when the file contents, modification time and parser all
+        match, so restarting against an unchanged file skips parsing. JSON specs are
+        not cached, as orjson parses them about as fast as the cache can be read.
+
         Args:
             file_path (str): The path to the OpenAPI file.
 
@@ -161,22 +424,109 @@ class MockyApp:
             ValueError: If the file format is unsupported or if parsing the OpenAPI file fails.
         """
         try:
-            with open(file_path, "r") as file:
-                if file_path.endswith(".yaml") or file_path.endswith(".yml"):
-                    return yaml.safe_load(file)
-                elif file_path.endswith(".json"):
-                    return json.load(file)
-                else:
-                    raise ValueError("Unsupported file format. Use JSON or YAML.")
+            if file_path.endswith(".json"):
+                with open(file_path, "rb", buffering=_READ_BUFFER_SIZE) as file:
+                    with _map_file(file) as data, memoryview(data) as view:
+                        return orjson.loads(view)
+            elif not (file_path.endswith(".yaml") or file_path.endswith(".yml")):
+                raise ValueError("Unsupported file format. Use JSON or YAML.")
+
+            # One cache entry per source file, so edits replace the previous entry
+            source_key = hashlib.sha256(os.path.realpath(file_path).encode())
+            cache_path = os.path.join(_cache_dir(), f"{source_key.hexdigest()}.pickle")
+
+            with open(file_path, "rb", buffering=_READ_BUFFER_SIZE) as file:
+                mtime_ns = os.fstat(file.fileno()).st_mtime_ns
+                with _map_file(file) as data:
+                    digest = hashlib.sha256(data)
+                    digest.update(f"{mtime_ns}:{_parser_identity()}".encode())
+                    fingerprint = digest.hexdigest()
+
+                    openapi_spec = self._load_cached_spec(cache_path, fingerprint)
+                    if openapi_spec is not None:
+                        return openapi_spec
+
+                    openapi_spec = _load_yaml(data)
         except Exception as e:
             raise ValueError(f"Failed to parse OpenAPI file: {e}")
 
+        self._store_cached_spec(cache_path, fingerprint, openapi_spec)
+        return openapi_spec
+
+    def _load_cached_spec(
+        self, cache_path: str, fingerprint: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a previously parsed OpenAPI specification from the on-disk cache.
+
+        Args:
+            cache_path (str): The path of the cache entry.
+            fingerprint (str): The fingerprint of the file contents, modification time
+                and parser the entry must have been stored with.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached specification, or None if there is no usable entry.
+        """
+        try:
+            with open(cache_path, "rb") as file:
+                cached_fingerprint, openapi_spec = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.app.logger.debug(f"Ignoring unreadable spec cache {cache_path}: {e}")
+            return None
+        if cached_fingerprint != fingerprint:
+            return None
+        return openapi_spec
+
+    def _store_cached_spec(
+        self, cache_path: str, fingerprint: str, openapi_spec: Dict[str, Any]
+    ):
+        """
+        Store a parsed OpenAPI specification in the on-disk cache.
+
+        The entry is written to a temporary file and moved into place so concurrent
+        processes never observe a partially written cache. It replaces any previous
+        entry for the same source file. Failures are logged and otherwise ignored, as
+        the cache is purely an optimisation.
+
+        Args:
+            cache_path (str): The path of the cache entry.
+            fingerprint (str): The fingerprint of the file contents, modification time
+                and parser.
+            openapi_spec (Dict[str, Any]): The parsed OpenAPI specification.
+        """
+        cache_dir = os.path.dirname(cache_path)
+        temp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=cache_dir, suffix=".tmp", delete=False
+            ) as file:
+                temp_path = file.name
+                pickle.dump(
+                    (fingerprint, openapi_spec),
+                    file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            self.app.logger.debug(f"Failed to write spec cache {cache_path}: {e}")
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_path)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
     def generate_default_response(
-        self, status: int, media_type: str = "application/json"
+        status: int, media_type: str = "application/json"
     ) -> Any:
         """
         Generate a default response based on the status code and media type.
 
+        Responses are cached per status and media type and shared between routes, so
+        JSON responses are returned as read-only mappings.
+
         Args:
             status (int): The HTTP status code for the response.
             media_type (str): The media type of the response. Defaults to "application/json".
@@ -185,7 +535,7 @@ class MockyApp:
             Any: The default response content.
         """
         if media_type == "application/json":
-            return {"status": status, "message": "Default response"}
+            return MappingProxyType({"status": status, "message": "Default response"})
         return f"Default response with status {status}"
 
     def convert_path(self, openapi_path: str) -> str:
@@ -201,12 +551,15 @@ class MockyApp:
         Returns:
             str: The converted path with angle brackets.
         """
-        return openapi_path.replace("{", "<").replace("}", ">")
+        return openapi_path.translate(_PATH_XLATE)
 
     def create_handler(self, operation: Dict[str, Any], example: Any, method: str):
         """
         Create a request handler for the given operation.
 
+        The handler is specialised for the HTTP method when it is created, so no
+        method dispatch happens while serving requests.
+
         Args:
             operation (Dict[str, Any]): The operation details, including parameters.
             example (Any): An example response to be used as a base for the response.
@@ -215,64 +568,166 @@ class MockyApp:
         Returns:
             function: A request handler function that processes the request based on the given operation and method.
         """
+        factories = {
+            "get": self._make_get_handler,
+            "post": self._make_post_handler,
+            "put": self._make_put_handler,
+            "delete": self._make_delete_handler,
+        }
+        factory = factories.get(method.lower(), self._make_unsupported_handler)
+        return factory(operation, example)
+
+    def _make_get_handler(self, operation: Dict[str, Any], example: Any):
+        """
+        Create a GET handler that echoes declared query parameters alongside the example.
+
+        Only declared query parameters present in the request are echoed. The example
+        is serialized once, so requests without any of them return the cached body
+        without any per-request encoding.
+
+        Args:
+            operation (Dict[str, Any]): The operation details, including parameters.
+            example (Any): The example response.
+
+        Returns:
+            function: The request handler.
+        """
+        query_names = frozenset(
+            param["name"]
+            for param in operation.get("parameters", [])
+            if param.get("in") == "query"
+        )
+
+        example_body = json_dumps(example)
+
+        if not query_names:
+
+            def handler():
+                """GET request handler"""
+                return _raw_json_response(example_body)
+
+            return handler
 
         def handler():
-            """Request handler function"""
-            query_params = {}
-            for param in operation.get("parameters", []):
-                if param.get("in") == "query":
-                    param_name = param["name"]
-                    query_params[param_name] = request.args.get(param_name)
-
-            if method.upper() == "POST":
-                try:
-                    if request.content_type == "application/json":
-                        data = request.json
-                        if isinstance(data, dict) and isinstance(example, dict):
-                            return jsonify({**example, **data})
-                    else:
-                        return jsonify({"error": "Unsupported Media Type"}), 415
-                except Exception:
-                    return jsonify({"error": "Invalid request body"}), 400
-            elif method.upper() == "GET":
-                if query_params:
-                    return jsonify({**example, "query_params": query_params})
-                return jsonify(example)
-            elif method.upper() == "PUT":
-                try:
-                    data = request.json
-                    if isinstance(data, dict) and isinstance(example, dict):
-                        return jsonify({**example, **data})
-                except Exception:
-                    return jsonify({"error": "Invalid request body"}), 400
-            elif method.upper() == "DELETE":
-                return jsonify({"message": "Resource deleted"}), 204
-            else:
-                return make_response(jsonify({"error": "Method not supported"}), 405)
+            """GET request handler"""
+            args = request.args
+            query_params = {name: args.get(name) for name in query_names & args.keys()}
+            if not query_params:
+                return _raw_json_response(example_body)
+            return _json_response({**example, "query_params": query_params})
+
+        return handler
 
-            return jsonify(example)
+    def _make_post_handler(self, operation: Dict[str, Any], example: Any):
+        """
+        Create a POST handler that merges a JSON request body into the example.
+
+        Args:
+            operation (Dict[str, Any]): The operation details.
+            example (Any): The example response.
+
+        Returns:
+            function: The request handler.
+        """
+        merge = example_merger(example)
+        example_body = json_dumps(example)
+
+        def handler():
+            """POST request handler"""
+            if request.content_type != "application/json":
+                return _json_response({"error": "Unsupported Media Type"}, 415)
+
+            data = request.get_json(cache=False, silent=True)
+            if data is None:
+                return _json_response({"error": "Invalid request body"}, 400)
+            if merge is not None and isinstance(data, dict):
+                return _raw_json_response(merge(data))
+
+            return _raw_json_response(example_body)
 
         return handler
 
-    def register_routes(self, openapi_spec: Dict[str, Any]):
+    def _make_put_handler(self, operation: Dict[str, Any], example: Any):
         """
-        Register routes based on the OpenAPI specification.
+        Create a PUT handler that merges a JSON request body into the example.
 
         Args:
-            openapi_spec (Dict[str, Any]): The OpenAPI specification containing paths and methods.
+            operation (Dict[str, Any]): The operation details.
+            example (Any): The example response.
 
-        This method iterates over the paths defined in the OpenAPI specification and registers
-        corresponding routes in the Flask application. For each path and method, it generates
-        a handler function and adds a URL rule to the Flask app. If a response example is provided
-        in the OpenAPI spec, it uses that example; otherwise, it generates a default response.
+        Returns:
+            function: The request handler.
+        """
+        merge = example_merger(example)
+        example_body = json_dumps(example)
+
+        def handler():
+            """PUT request handler"""
+            data = request.get_json(cache=False, silent=True)
+            if data is None:
+                return _json_response({"error": "Invalid request body"}, 400)
+            if merge is not None and isinstance(data, dict):
+                return _raw_json_response(merge(data))
+
+            return _raw_json_response(example_body)
+
+        return handler
+
+    def _make_delete_handler(self, operation: Dict[str, Any], example: Any):
+        """
+        Create a DELETE handler.
+
+        Args:
+            operation (Dict[str, Any]): The operation details.
+            example (Any): The example response.
 
-        The method also logs the registration process and increments a dynamic routes counter if
-        metering is enabled.
+        Returns:
+            function: The request handler.
+        """
+
+        def handler():
+            """DELETE request handler"""
+            return _json_response({"message": "Resource deleted"}, 204)
+
+        return handler
+
+    def _make_unsupported_handler(self, operation: Dict[str, Any], example: Any):
+        """
+        Create a handler for HTTP methods Mocky does not simulate.
+
+        Args:
+            operation (Dict[str, Any]): The operation details.
+            example (Any): The example response.
+
+        Returns:
+            function: The request handler.
+        """
+
+        def handler():
+            """Unsupported method request handler"""
+            return _json_response({"error": "Method not supported"}, 405)
+
+        return handler
+
+    def iter_operations(
+        self, openapi_spec: Dict[str, Any]
+    ) -> Iterator[Tuple[str, str, Dict[str, Any], Any]]:
+        """
+        Iterate over the operations defined in the OpenAPI specification.
+
+        If a response example is provided in the OpenAPI spec, it is used as the example;
+        otherwise, a default response is generated.
+
+        Args:
+            openapi_spec (Dict[str, Any]): The OpenAPI specification containing paths and methods.
+
+        Yields:
+            Tuple[str, str, Dict[str, Any], Any]: The OpenAPI path, HTTP method, operation
+            details and example response of each operation.
         """
         paths = openapi_spec.get("paths", {})
         for openapi_path, methods in paths.items():
             self.app.logger.debug(f"Registering path: {openapi_path}")
-            flask_path = self.convert_path(openapi_path)
             for method, operation in methods.items():
                 self.app.logger.debug(f"Registering method: {method}")
                 responses = operation.get("responses", {})
@@ -285,15 +740,41 @@ class MockyApp:
                 else:
                     example = default_resp
 
-                handler = self.create_handler(operation, example, method)
-                if self.meter:
-                    self.dynamic_routes_counter.add(1)
-                self.app.add_url_rule(
-                    flask_path,
-                    endpoint=f"{flask_path}_{method}",
-                    view_func=handler,
-                    methods=[method.upper()],
-                )
+                yield openapi_path, method, operation, example
+
+    def register_routes(self, openapi_spec: Dict[str, Any]):
+        """
+        Register routes based on the OpenAPI specification.
+
+        Args:
+            openapi_spec (Dict[str, Any]): The OpenAPI specification containing paths and methods.
+
+        This method iterates over the paths defined in the OpenAPI specification and registers
+        corresponding routes in the Flask application. For each path and method, it generates
+        a handler function and adds a URL rule to the Flask app. If a response example is provided
+        in the OpenAPI spec, it uses that example; otherwise, it generates a default response.
+
+        The method also logs the registration process and, if metering is enabled, adds the
+        number of registered routes to the dynamic routes counter in a single measurement.
+        """
+        route_count = 0
+        for openapi_path, method, operation, example in self.iter_operations(
+            openapi_spec
+        ):
+            flask_path = self.convert_path(openapi_path)
+            handler = self.create_handler(operation, example, method)
+            self.app.add_url_rule(
+                flask_path,
+                endpoint=f"{flask_path}_{method}",
+                view_func=handler,
+                methods=[method.upper()],
+            )
+            route_count += 1
+
+        if self.meter and route_count:
+            self.dynamic_routes_counter.add(route_count)
+
+        self._refresh_routes_response()
 
     def root(self):
         """
@@ -302,7 +783,7 @@ class MockyApp:
         Returns:
             Response: A JSON response with a message indicating the user might be in the wrong place.
         """
-        return jsonify({"message": "Are you meant to be here?"})
+        return _raw_json_response(self.root_body)
 
     def info(self):
         """
@@ -311,22 +792,7 @@ class MockyApp:
         Returns:
             Response: A JSON response containing the application's name, version, description, author, company, and repository URL.
         """
-        application_name = "Mocky"
-        application_version = "0.0.1"
-        application_description = "Mocky is a HTTP mock service, it can read OpenAPI 3.1 specification and return example data."
-        application_author = "Michael Leer"
-        application_company = "Gremlin LTD"
-        application_repository = "https://github.com/trozz/mocky"
-
-        application_info_as_dict = {
-            "name": application_name,
-            "version": application_version,
-            "description": application_description,
-            "author": application_author,
-            "company": application_company,
-            "repository": application_repository,
-        }
-        return jsonify(application_info_as_dict)
+        return _raw_json_response(self.info_body)
 
     def health(self):
         """
@@ -335,18 +801,15 @@ class MockyApp:
         Returns:
             Response: A JSON response with the status of the service.
         """
-        return jsonify({"status": "ok"})
+        return _raw_json_response(self.health_body)
 
-    def routes(self):
+    def _refresh_routes_response(self):
         """
-        Generates a list of routes defined in the application.
+        Serialize the current list of routes for the routes endpoint.
 
         Iterates over the URL map rules of the application and constructs a list of
         dictionaries, each containing the path and allowed methods (excluding "HEAD")
-        for each route.
-
-        Returns:
-            Response: A JSON response containing the list of routes.
+        for each route. Must be called whenever rules are added to the URL map.
         """
         route_list = []
         for rule in self.app.url_map.iter_rules():
@@ -356,22 +819,138 @@ class MockyApp:
                     "methods": [m for m in rule.methods if m != "HEAD"],
                 }
             )
-        return jsonify(route_list)
+        self._routes_response = orjson.dumps(route_list)
+
+    def routes(self):
+        """
+        Generates a list of routes defined in the application.
+
+        The list is serialized when routes are registered, so requests only return
+        the cached body.
+
+        Returns:
+            Response: A JSON response containing the list of routes.
+        """
+        return _raw_json_response(self._routes_response)
 
     def run(self):
         """
         Runs the application server.
 
-        This method starts the application server using the host, port, and debug
-        settings specified in the command-line arguments.
+        This method starts the server selected with ``--server`` using the host and
+        port specified in the command-line arguments. Debug mode always runs the Flask
+        development server so the reloader and debugger are available. The Starlette
+        framework is always served by uvicorn.
 
         Args:
             None
 
         Returns:
             None
+
+        Raises:
+            RuntimeError: If the selected server is not installed.
+        """
+        if self.args.framework == "starlette":
+            self._run_uvicorn()
+        elif self.args.debug or self.args.server == "dev":
+            self.app.run(
+                host=self.args.host, port=self.args.port, debug=self.args.debug
+            )
+        elif self.args.server == "waitress":
+            self._run_waitress()
+        else:
+            self._run_gunicorn()
+
+    def _run_uvicorn(self):
         """
-        self.app.run(host=self.args.host, port=self.args.port, debug=self.args.debug)
+        Runs the Starlette application with uvicorn.
+
+        Raises:
+            RuntimeError: If uvicorn is not installed.
+        """
+        try:
+            import uvicorn
+        except ImportError:
+            self.app.logger.error("uvicorn is not installed")
+            raise RuntimeError(
+                "uvicorn is not installed. Install it or use --framework flask."
+            )
+
+        uvicorn.run(
+            self.asgi_app,
+            host=self.args.host,
+            port=self.args.port,
+            log_level="debug" if self.args.debug else "info",
+        )
+
+    def _worker_count(self) -> int:
+        """
+        Return the number of workers to serve requests with.
+
+        Returns:
+            int: Twice the number of CPUs plus one.
+        """
+        return (os.cpu_count() or 1) * 2 + 1
+
+    def _run_gunicorn(self):
+        """
+        Runs the application with gunicorn using threaded workers.
+
+        Each of the ``gthread`` workers serves requests from several threads.
+
+        Raises:
+            RuntimeError: If gunicorn is not installed.
+        """
+        try:
+            from gunicorn.app.base import BaseApplication
+        except ImportError:
+            self.app.logger.error("gunicorn is not installed")
+            raise RuntimeError(
+                "gunicorn is not installed. Install it or use --server waitress/dev."
+            )
+
+        application = self.app
+        options = {
+            "bind": f"{self.args.host}:{self.args.port}",
+            "workers": self._worker_count(),
+            "worker_class": "gthread",
+            "threads": _GUNICORN_THREADS,
+        }
+
+        class GunicornApplication(BaseApplication):
+            """gunicorn application serving the Flask app with the options above."""
+
+            def load_config(self):
+                for key, value in options.items():
+                    self.cfg.set(key, value)
+
+            def load(self):
+                return application
+
+        GunicornApplication().run()
+
+    def _run_waitress(self):
+        """
+        Runs the application with waitress.
+
+        Raises:
+            RuntimeError: If waitress is not installed.
+        """
+        try:
+            from waitress import serve
+        except ImportError:
+            self.app.logger.error("waitress is not installed")
+            raise RuntimeError(
+                "waitress is not installed. Install it or use --server gunicorn/dev."
+            )
+
+        serve(
+            self.app,
+            host=self.args.host,
+            port=self.args.port,
+            threads=self._worker_count(),
+        )
 
 
 def main():
@@ -0,0 +1,70 @@
+from typing import Any, Callable, Dict, Mapping, Optional
+import orjson
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Convert objects orjson cannot serialize natively, such as read-only mappings.
+
+    Args:
+        obj (Any): The object orjson could not serialize.
+
+    Returns:
+        Any: A serializable equivalent of the object.
+
+    Raises:
+        TypeError: If the object has no serializable equivalent.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes with orjson.
+
+    Args:
+        obj (Any): The object to serialize.
+
+    Returns:
+        bytes: The JSON encoded object.
+    """
+    return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def example_merger(example: Any) -> Optional[Callable[[Dict[str, Any]], bytes]]:
+    """
+    Build a function that returns the JSON encoding of ``{**example, **data}``.
+
+    The example is serialized once. When a request body shares no keys with the
+    example, its encoding is spliced onto the serialized example instead of
+    merging and re-encoding both dictionaries. Examples with non-string top-level
+    keys cannot be compared against the body's keys, so they are always merged.
+
+    Args:
+        example (Any): The example response.
+
+    Returns:
+        Optional[Callable[[Dict[str, Any]], bytes]]: The merge function, or None if
+        the example is not a mapping.
+    """
+    if not isinstance(example, Mapping):
+        return None
+
+    example = dict(example)
+    example_bytes = json_dumps(example)
+    if not example:
+        return json_dumps
+
+    can_splice = all(isinstance(k, str) for k in example)
+    example_prefix = example_bytes[:-1] + b","
+
+    def merge(data: Dict[str, Any]) -> bytes:
+        if not data:
+            return example_bytes
+        if can_splice and example.keys().isdisjoint(data):
+            return example_prefix + json_dumps(data)[1:]
+        return json_dumps({**example, **data})
+
+    return merge
@@ -7,12 +7,18 @@ setup(
     include_package_data=True,
     install_requires=[
         "Flask==3.1.0",
+        'gunicorn==23.0.0; platform_system != "Windows"',
         "opentelemetry-api==1.29.0",
         "opentelemetry-instrumentation",
         "opentelemetry-instrumentation-flask",
         "opentelemetry-sdk==1.29.0",
+        "orjson==3.10.12",
         "PyYAML==6.0.2",
     ],
+    extras_require={
+        "starlette": ["starlette==0.41.3", "uvicorn==0.32.1"],
+        "waitress": ["waitress==3.0.2"],
+    },
     entry_points={
         "console_scripts": [
             "mocky=mocky.main:main",
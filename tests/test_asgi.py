@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import argparse
+from starlette.testclient import TestClient
+from mocky.main import MockyApp
+
+
+class TestStarletteApp(unittest.TestCase):
+    def setUp(self):
+        self.mock_parse_args = patch("argparse.ArgumentParser.parse_args").start()
+        self.addCleanup(patch.stopall)
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patch.dict(os.environ, {"XDG_CACHE_HOME": cache_dir.name}).start()
+
+    def initialize_app(self, file: str):
+        self.mock_parse_args.return_value = argparse.Namespace(
+            file=file,
+            port=8080,
+            host="127.0.0.1",
+            debug=True,
+            otel=False,
+            server="gunicorn",
+            framework="starlette",
+        )
+        self.mocky_app = MockyApp()
+        self.client = TestClient(self.mocky_app.asgi_app)
+
+    def test_fixed_routes(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                response = self.client.get("/")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    response.json(), {"message": "Are you meant to be here?"}
+                )
+                response = self.client.get("/mocky/health")
+                self.assertEqual(response.json(), {"status": "ok"})
+                response = self.client.get("/mocky/routes")
+                paths = {route["path"] for route in response.json()}
+                self.assertIn("/items", paths)
+                self.assertIn("/mocky/routes", paths)
+
+    def test_flask_app_not_set_up(self):
+        self.initialize_app("openapi.yaml")
+        rules = {rule.rule for rule in self.mocky_app.app.url_map.iter_rules()}
+        self.assertNotIn("/mocky/routes", rules)
+        self.assertNotIn("/", rules)
+
+    def test_get(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                response = self.client.get("/items")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    response.json(),
+                    [{"id": 1, "name": "Item 1"}, {"id": 2, "name": "Item 2"}],
+                )
+
+    def test_post(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                response = self.client.post("/items", json={"name": "Item 3"})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()["name"], "Item 3")
+                response = self.client.post(
+                    "/items",
+                    content="{",
+                    headers={"Content-Type": "application/json"},
+                )
+                self.assertEqual(response.status_code, 400)
+                response = self.client.post("/items", data={"name": "Item 3"})
+                self.assertEqual(response.status_code, 415)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,12 @@
+import io
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 import argparse
+import yaml
 from flask import Flask
+import mocky.main
 from mocky.main import MockyApp
 
 
@@ -10,10 +15,19 @@ class BaseMockyAppTest(unittest.TestCase):
     def setUp(self):
         self.mock_parse_args = patch("argparse.ArgumentParser.parse_args").start()
         self.addCleanup(patch.stopall)
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patch.dict(os.environ, {"XDG_CACHE_HOME": cache_dir.name}).start()
 
-    def initialize_app(self, file: str):
+    def initialize_app(self, file: str, otel: bool = False):
         self.mock_parse_args.return_value = argparse.Namespace(
-            file=file, port=8080, host="127.0.0.1", debug=True, otel=False
+            file=file,
+            port=8080,
+            host="127.0.0.1",
+            debug=True,
+            otel=otel,
+            server="gunicorn",
+            framework="flask",
         )
         self.mocky_app = MockyApp()
         self.mocky_app.args = self.mock_parse_args.return_value
@@ -43,6 +57,17 @@ class TestMockyApp(BaseMockyAppTest):
                 response = self.get_and_assert("/mocky/health")
                 self.assertEqual(response.json, {"status": "ok"})
 
+    def test_info(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                response = self.get_and_assert("/mocky/info")
+                self.assertEqual(response.json["name"], "Mocky")
+                self.assertEqual(response.json["version"], "0.0.1")
+                self.assertEqual(
+                    int(response.headers["Content-Length"]), len(response.get_data())
+                )
+
     def test_routes(self):
         for file in ["openapi.yaml"]:
             with self.subTest(file=file):
@@ -64,6 +89,18 @@ class TestMockyApp(BaseMockyAppTest):
                     )
                 )
 
+    def test_generated_route_options_and_head(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                response = self.client.options("/items")
+                self.assertEqual(response.status_code, 200)
+                self.assertIn("GET", response.headers["Allow"])
+                self.assertIn("POST", response.headers["Allow"])
+                response = self.client.head("/items")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.get_data(), b"")
+
     def test_load_and_register_routes(self):
         for file in ["openapi.yaml"]:
             with self.subTest(file=file):
@@ -90,6 +127,151 @@ class TestMockyApp(BaseMockyAppTest):
                     response = self.client.get("/test")
                     self.assertEqual(response.status_code, 200)
                     self.assertEqual(response.json, {"message": "test"})
+                    response = self.get_and_assert("/mocky/routes")
+                    self.assertTrue(
+                        any(route["path"] == "/test" for route in response.json)
+                    )
+
+    def test_load_and_register_routes_parses_once(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                with patch(
+                    "mocky.main._load_yaml", wraps=mocky.main._load_yaml
+                ) as mock_load_yaml, patch.object(
+                    MockyApp, "_load_cached_spec", return_value=None
+                ):
+                    self.initialize_app(file)
+                mock_load_yaml.assert_called_once()
+
+    def test_parse_openapi_prefers_yaml_rs(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                with patch("mocky.main.yaml_rs") as mock_yaml_rs, patch.object(
+                    MockyApp, "_load_cached_spec", return_value=None
+                ):
+                    mock_yaml_rs.loads.return_value = {"paths": {}}
+                    spec = self.mocky_app._parse_openapi(file)
+                    self.assertEqual(spec, {"paths": {}})
+                    mock_yaml_rs.loads.assert_called_once()
+                    (document,), _ = mock_yaml_rs.loads.call_args
+                    self.assertIsInstance(document, str)
+                    with open(file, encoding="utf-8") as spec_file:
+                        self.assertEqual(document, spec_file.read())
+
+    @unittest.skipIf(mocky.main.yaml_rs is None, "yaml_rs is not installed")
+    def test_parse_openapi_with_yaml_rs(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                with patch.object(MockyApp, "_load_cached_spec", return_value=None):
+                    spec = self.mocky_app._parse_openapi(file)
+                with open(file, "rb") as spec_file:
+                    expected = yaml.load(spec_file, Loader=yaml.SafeLoader)
+                self.assertEqual(spec, expected)
+
+    def test_parse_openapi_uses_cache(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                expected = self.mocky_app._parse_openapi(file)
+                with patch("mocky.main._load_yaml") as mock_load_yaml:
+                    spec = self.mocky_app._parse_openapi(file)
+                    mock_load_yaml.assert_not_called()
+                self.assertEqual(spec, expected)
+
+    def test_parse_openapi_json_skips_cache(self):
+        for file in ["tests/openapi.json"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                with patch.object(
+                    MockyApp, "_load_cached_spec"
+                ) as mock_load, patch.object(
+                    MockyApp, "_store_cached_spec"
+                ) as mock_store:
+                    spec = self.mocky_app._parse_openapi(file)
+                    mock_load.assert_not_called()
+                    mock_store.assert_not_called()
+                self.assertIn("paths", spec)
+
+    def test_parse_openapi_cache_keyed_by_parser(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                self.mocky_app._parse_openapi(file)
+                with patch("mocky.main.yaml_rs") as mock_yaml_rs:
+                    mock_yaml_rs.__version__ = "0.0.0-test"
+                    mock_yaml_rs.loads.return_value = {"paths": {}}
+                    spec = self.mocky_app._parse_openapi(file)
+                    mock_yaml_rs.loads.assert_called_once()
+                self.assertEqual(spec, {"paths": {}})
+
+    def test_parse_openapi_cache_one_entry_per_file(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                with tempfile.TemporaryDirectory() as tmp:
+                    spec_path = os.path.join(tmp, "spec.yaml")
+                    for mtime_ns in (1_000_000_000, 2_000_000_000):
+                        with open(spec_path, "w") as spec_file:
+                            spec_file.write("paths: {}\n")
+                        os.utime(spec_path, ns=(mtime_ns, mtime_ns))
+                        self.mocky_app._parse_openapi(spec_path)
+                cache_dir = os.path.join(os.environ["XDG_CACHE_HOME"], "mocky")
+                # One entry for the spec loaded by initialize_app, one for spec.yaml
+                self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_store_cached_spec_removes_temp_file_on_failure(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                with tempfile.TemporaryDirectory() as tmp:
+                    cache_path = os.path.join(tmp, "entry.pickle")
+                    self.mocky_app._store_cached_spec(
+                        cache_path, "fingerprint", {"f": lambda: 1}
+                    )
+                    self.assertEqual(os.listdir(tmp), [])
+
+    def test_parse_openapi_empty_file(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                with tempfile.TemporaryDirectory() as tmp:
+                    empty = os.path.join(tmp, "empty.json")
+                    open(empty, "wb").close()
+                    with self.assertRaises(ValueError):
+                        self.mocky_app._parse_openapi(empty)
+
+    def test_register_routes_counts_routes_once(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                self.mocky_app.meter = MagicMock()
+                self.mocky_app.dynamic_routes_counter = MagicMock()
+                self.mocky_app.register_routes(
+                    {"paths": {"/counted": {"get": {}, "post": {}}}}
+                )
+                self.mocky_app.dynamic_routes_counter.add.assert_called_once_with(2)
+
+    def test_otel_enabled(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                from opentelemetry.sdk.metrics.export import ConsoleMetricExporter
+
+                with patch(
+                    "opentelemetry.sdk.metrics.export.ConsoleMetricExporter",
+                    lambda: ConsoleMetricExporter(out=io.StringIO()),
+                ):
+                    self.initialize_app(file, otel=True)
+                self.assertIsNotNone(self.mocky_app.meter)
+                self.assertIsNotNone(self.mocky_app.dynamic_routes_counter)
+                self.get_and_assert("/mocky/health")
+
+    def test_no_instance_dict(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                self.assertFalse(hasattr(self.mocky_app, "__dict__"))
 
     def test_generate_default_response(self):
         for file in ["openapi.yaml"]:
@@ -99,6 +281,19 @@ class TestMockyApp(BaseMockyAppTest):
                 self.assertEqual(
                     response, {"status": 200, "message": "Default response"}
                 )
+                self.assertIs(response, self.mocky_app.generate_default_response(200))
+                with self.assertRaises(TypeError):
+                    response["status"] = 500
+
+    def test_default_response_route(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                self.mocky_app.register_routes({"paths": {"/default": {"get": {}}}})
+                response = self.get_and_assert("/default")
+                self.assertEqual(
+                    response.json, {"status": 200, "message": "Default response"}
+                )
 
     def test_convert_path(self):
         for file in ["openapi.yaml"]:
@@ -131,6 +326,10 @@ class TestMockyApp(BaseMockyAppTest):
                         response.json,
                         {"message": "test", "query_params": {"param1": "value1"}},
                     )
+                with self.app.test_request_context("/test?other=value"):
+                    response = handler()
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(response.json, {"message": "test"})
 
     def test_create_handler_post(self):
         for file in ["openapi.yaml"]:
@@ -153,6 +352,74 @@ class TestMockyApp(BaseMockyAppTest):
                     response = handler()
                     self.assertEqual(response.status_code, 200)
                     self.assertEqual(response.json, {"message": "test", "key": "value"})
+                with self.app.test_request_context(
+                    "/test", method="POST", data="{", content_type="application/json"
+                ):
+                    response = handler()
+                    self.assertEqual(response.status_code, 400)
+                    self.assertEqual(response.json, {"error": "Invalid request body"})
+                with self.app.test_request_context(
+                    "/test", method="POST", data="key=value"
+                ):
+                    response = handler()
+                    self.assertEqual(response.status_code, 415)
+
+    def test_create_handler_post_merges_body(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                example = {"message": "test", "id": 1}
+                handler = self.mocky_app.create_handler({}, example, "post")
+                for body, expected in [
+                    ({}, {"message": "test", "id": 1}),
+                    ({"key": "value"}, {"message": "test", "id": 1, "key": "value"}),
+                    ({"message": "override"}, {"message": "override", "id": 1}),
+                ]:
+                    with self.app.test_request_context(
+                        "/test", method="POST", json=body
+                    ):
+                        response = handler()
+                        self.assertEqual(response.status_code, 200)
+                        self.assertEqual(response.json, expected)
+                        self.assertEqual(response.get_data().count(b'"message"'), 1)
+
+    def test_create_handler_post_merges_non_string_keys(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                for example, expected in [
+                    (
+                        {"a": 1, "codes": {200: "ok"}},
+                        {"a": 1, "codes": {"200": "ok"}, "k": "v"},
+                    ),
+                    ({200: "ok"}, {"200": "ok", "k": "v"}),
+                ]:
+                    handler = self.mocky_app.create_handler({}, example, "post")
+                    with self.app.test_request_context(
+                        "/test", method="POST", json={"k": "v"}
+                    ):
+                        response = handler()
+                        self.assertEqual(response.status_code, 200)
+                        self.assertEqual(response.json, expected)
+
+    def test_create_handler_put(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                example = {"message": "test"}
+                handler = self.mocky_app.create_handler({}, example, "put")
+                with self.app.test_request_context(
+                    "/test", method="PUT", json={"message": "updated"}
+                ):
+                    response = handler()
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(response.json, {"message": "updated"})
+                with self.app.test_request_context(
+                    "/test", method="PUT", data="not json"
+                ):
+                    response = handler()
+                    self.assertEqual(response.status_code, 400)
+                    self.assertEqual(response.json, {"error": "Invalid request body"})
 
     def test_create_handler_unsupported_method(self):
         for file in ["openapi.yaml"]:
@@ -174,6 +441,97 @@ class TestMockyApp(BaseMockyAppTest):
                     self.assertEqual(response.status_code, 405)
                     self.assertEqual(response.json, {"error": "Method not supported"})
 
+    def test_starlette_not_installed(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.mock_parse_args.return_value = argparse.Namespace(
+                    file=file,
+                    port=8080,
+                    host="127.0.0.1",
+                    debug=False,
+                    otel=False,
+                    server="gunicorn",
+                    framework="starlette",
+                )
+                with patch.dict("sys.modules", {"mocky.asgi": None}):
+                    with self.assertRaisesRegex(
+                        RuntimeError, "starlette is not installed"
+                    ):
+                        MockyApp()
+
+    def test_run_debug_uses_dev_server(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                with patch.object(self.app, "run") as mock_run:
+                    self.mocky_app.run()
+                    mock_run.assert_called_once_with(
+                        host="127.0.0.1", port=8080, debug=True
+                    )
+
+    def test_run_waitress(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                self.mocky_app.args.debug = False
+                self.mocky_app.args.server = "waitress"
+                mock_waitress = MagicMock()
+                with patch.dict("sys.modules", {"waitress": mock_waitress}):
+                    self.mocky_app.run()
+                mock_waitress.serve.assert_called_once()
+                args, kwargs = mock_waitress.serve.call_args
+                self.assertIs(args[0], self.app)
+                self.assertEqual(kwargs["host"], "127.0.0.1")
+                self.assertEqual(kwargs["port"], 8080)
+
+    def test_run_gunicorn(self):
+        for file in ["openapi.yaml"]:
+            with self.subTest(file=file):
+                self.initialize_app(file)
+                self.mocky_app.args.debug = False
+                applications = []
+
+                class BaseApplication:
+                    def __init__(self):
+                        self.cfg = MagicMock()
+
+                    def run(self):
+                        self.load_config()
+                        applications.append(self)
+
+                mock_base = MagicMock(BaseApplication=BaseApplication)
+                with patch.dict("sys.modules", {"gunicorn.app.base": mock_base}):
+                    self.mocky_app.run()
+                (application,) = applications
+                options = dict(call.args for call in application.cfg.set.call_args_list)
+                self.assertEqual(options["bind"], "127.0.0.1:8080")
+                self.assertEqual(options["workers"], self.mocky_app._worker_count())
+                self.assertEqual(options["worker_class"], "gthread")
+                self.assertEqual(options["threads"], mocky.main._GUNICORN_THREADS)
+                self.assertIs(application.load(), self.app)
+
+    def test_default_server(self):
+        available = {"gunicorn.app.base": MagicMock(), "waitress": MagicMock()}
+        missing = {"gunicorn.app.base": None, "waitress": None}
+        cases = [
+            ("gunicorn", available),
+            ("waitress", {**available, "gunicorn.app.base": None}),
+            ("dev", missing),
+        ]
+        for server, modules in cases:
+            with self.subTest(server=server):
+                self.mock_parse_args.return_value = argparse.Namespace(
+                    file="openapi.yaml",
+                    port=8080,
+                    host="127.0.0.1",
+                    debug=False,
+                    otel=False,
+                    server=None,
+                    framework="flask",
+                )
+                with patch.dict("sys.modules", modules):
+                    self.assertEqual(MockyApp().args.server, server)
+
 
 if __name__ == "__main__":
     unittest.main()